@@ -1,7 +1,9 @@
 import pickle
 from enum import Enum
-from typing import Any, Dict, Mapping, Optional, Sequence, Union
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Union
 
+from langchain_core.language_models.base import LanguageModelLike
 from langchain_core.messages import AnyMessage
 from langchain_core.runnables import (
     ConfigurableField,
@@ -71,55 +73,92 @@ class AgentType(str, Enum):
     OLLAMA = "Ollama"
 
 
+class LLMType(str, Enum):
+    GPT_35_TURBO = "GPT 3.5 Turbo"
+    GPT_4 = "GPT 4 Turbo"
+    AZURE_OPENAI = "GPT 4 (Azure OpenAI)"
+    CLAUDE2 = "Claude 2"
+    BEDROCK_CLAUDE2 = "Claude 2 (Amazon Bedrock)"
+    GEMINI = "GEMINI"
+    MIXTRAL = "Mixtral"
+    OLLAMA = "Ollama"
+
+
 DEFAULT_SYSTEM_MESSAGE = "You are a helpful assistant."
 
 CHECKPOINTER = PostgresCheckpoint(serde=pickle, at=CheckpointAt.END_OF_STEP)
 
+_LLMS: dict[LLMType, Callable[[], LanguageModelLike]] = {
+    LLMType.GPT_35_TURBO: get_openai_llm,
+    LLMType.GPT_4: partial(get_openai_llm, gpt_4=True),
+    LLMType.AZURE_OPENAI: partial(get_openai_llm, azure=True),
+    LLMType.CLAUDE2: get_anthropic_llm,
+    LLMType.BEDROCK_CLAUDE2: partial(get_anthropic_llm, bedrock=True),
+    LLMType.GEMINI: get_google_llm,
+    LLMType.MIXTRAL: get_mixtral_fireworks,
+    LLMType.OLLAMA: get_ollama_llm,
+}
+
+_AGENT_EXECUTORS: dict[
+    AgentType, tuple[Callable[[], LanguageModelLike], Callable[..., Pregel]]
+] = {
+    AgentType.GPT_35_TURBO: (_LLMS[LLMType.GPT_35_TURBO], get_tools_agent_executor),
+    AgentType.GPT_4: (_LLMS[LLMType.GPT_4], get_tools_agent_executor),
+    AgentType.AZURE_OPENAI: (_LLMS[LLMType.AZURE_OPENAI], get_tools_agent_executor),
+    AgentType.CLAUDE2: (_LLMS[LLMType.CLAUDE2], get_tools_agent_executor),
+    AgentType.BEDROCK_CLAUDE2: (
+        _LLMS[LLMType.BEDROCK_CLAUDE2],
+        get_xml_agent_executor,
+    ),
+    AgentType.GEMINI: (_LLMS[LLMType.GEMINI], get_tools_agent_executor),
+    AgentType.OLLAMA: (_LLMS[LLMType.OLLAMA], get_tools_agent_executor),
+}
+
+
+def get_llm(llm_type: LLMType) -> LanguageModelLike:
+    try:
+        llm_factory = _LLMS[llm_type]
+    except KeyError:
+        raise ValueError("Unexpected llm type")
+    return llm_factory()
+
+
+class _ToolSet(tuple):
+    """Tuple of tools hashed by identity so it can be used as a cache key.
+
+    Tools aren't hashable, but the cached factories in app.tools hand back the
+    same objects for the same config. Tools from uncached factories (the Action
+    Server) are new objects every time, so those tool sets skip the cache.
+    """
+
+    def __hash__(self) -> int:
+        return hash(tuple(id(t) for t in self))
 
+    def __eq__(self, other: object) -> bool:
+        return (
+            isinstance(other, _ToolSet)
+            and len(self) == len(other)
+            and all(a is b for a, b in zip(self, other))
+        )
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+
+@lru_cache(maxsize=256)
 def get_agent_executor(
-    tools: list,
+    tools: _ToolSet,
     agent: AgentType,
     system_message: str,
     interrupt_before_action: bool,
 ):
-    if agent == AgentType.GPT_35_TURBO:
-        llm = get_openai_llm()
-        return get_tools_agent_executor(
-            tools, llm, system_message, interrupt_before_action, CHECKPOINTER
-        )
-    elif agent == AgentType.GPT_4:
-        llm = get_openai_llm(gpt_4=True)
-        return get_tools_agent_executor(
-            tools, llm, system_message, interrupt_before_action, CHECKPOINTER
-        )
-    elif agent == AgentType.AZURE_OPENAI:
-        llm = get_openai_llm(azure=True)
-        return get_tools_agent_executor(
-            tools, llm, system_message, interrupt_before_action, CHECKPOINTER
-        )
-    elif agent == AgentType.CLAUDE2:
-        llm = get_anthropic_llm()
-        return get_tools_agent_executor(
-            tools, llm, system_message, interrupt_before_action, CHECKPOINTER
-        )
-    elif agent == AgentType.BEDROCK_CLAUDE2:
-        llm = get_anthropic_llm(bedrock=True)
-        return get_xml_agent_executor(
-            tools, llm, system_message, interrupt_before_action, CHECKPOINTER
-        )
-    elif agent == AgentType.GEMINI:
-        llm = get_google_llm()
-        return get_tools_agent_executor(
-            tools, llm, system_message, interrupt_before_action, CHECKPOINTER
-        )
-    elif agent == AgentType.OLLAMA:
-        llm = get_ollama_llm()
-        return get_tools_agent_executor(
-            tools, llm, system_message, interrupt_before_action, CHECKPOINTER
-        )
-
-    else:
+    try:
+        llm_factory, executor_factory = _AGENT_EXECUTORS[agent]
+    except KeyError:
         raise ValueError("Unexpected agent type")
+    return executor_factory(
+        tools, llm_factory(), system_message, interrupt_before_action, CHECKPOINTER
+    )
 
 
 class ConfigurableAgent(RunnableBinding):
@@ -148,6 +187,7 @@ class ConfigurableAgent(RunnableBinding):
     ) -> None:
         others.pop("bound", None)
         _tools = []
+        cacheable = True
         for _tool in tools:
             if _tool["type"] == AvailableTools.RETRIEVAL:
                 if assistant_id is None or thread_id is None:
@@ -158,15 +198,17 @@ class ConfigurableAgent(RunnableBinding):
                     get_retrieval_tool(assistant_id, thread_id, retrieval_description)
                 )
             else:
-                tool_config = _tool.get("config", {})
-                _returned_tools = TOOLS[_tool["type"]](**tool_config)
+                # Config-less tools come straight from their cached singletons
+                tool_config = _tool.get("config")
+                get_tool = TOOLS[_tool["type"]]
+                cacheable = cacheable and hasattr(get_tool, "cache_info")
+                _returned_tools = get_tool(**tool_config) if tool_config else get_tool()
                 if isinstance(_returned_tools, list):
                     _tools.extend(_returned_tools)
                 else:
                     _tools.append(_returned_tools)
-        _agent = get_agent_executor(
-            _tools, agent, system_message, interrupt_before_action
-        )
+        build = get_agent_executor if cacheable else get_agent_executor.__wrapped__
+        _agent = build(_ToolSet(_tools), agent, system_message, interrupt_before_action)
         agent_executor = _agent.with_config({"recursion_limit": 50})
         super().__init__(
             tools=tools,
@@ -179,39 +221,12 @@ class ConfigurableAgent(RunnableBinding):
         )
 
 
-class LLMType(str, Enum):
-    GPT_35_TURBO = "GPT 3.5 Turbo"
-    GPT_4 = "GPT 4 Turbo"
-    AZURE_OPENAI = "GPT 4 (Azure OpenAI)"
-    CLAUDE2 = "Claude 2"
-    BEDROCK_CLAUDE2 = "Claude 2 (Amazon Bedrock)"
-    GEMINI = "GEMINI"
-    MIXTRAL = "Mixtral"
-    OLLAMA = "Ollama"
-
-
+@lru_cache(maxsize=256)
 def get_chatbot(
     llm_type: LLMType,
     system_message: str,
 ):
-    if llm_type == LLMType.GPT_35_TURBO:
-        llm = get_openai_llm()
-    elif llm_type == LLMType.GPT_4:
-        llm = get_openai_llm(gpt_4=True)
-    elif llm_type == LLMType.AZURE_OPENAI:
-        llm = get_openai_llm(azure=True)
-    elif llm_type == LLMType.CLAUDE2:
-        llm = get_anthropic_llm()
-    elif llm_type == LLMType.BEDROCK_CLAUDE2:
-        llm = get_anthropic_llm(bedrock=True)
-    elif llm_type == LLMType.GEMINI:
-        llm = get_google_llm()
-    elif llm_type == LLMType.MIXTRAL:
-        llm = get_mixtral_fireworks()
-    elif llm_type == LLMType.OLLAMA:
-        llm = get_ollama_llm()
-    else:
-        raise ValueError("Unexpected llm type")
+    llm = get_llm(llm_type)
     return get_chatbot_executor(llm, system_message, CHECKPOINTER)
 
 
@@ -274,24 +289,7 @@ class ConfigurableRetrieval(RunnableBinding):
     ) -> None:
         others.pop("bound", None)
         retriever = get_retriever(assistant_id, thread_id)
-        if llm_type == LLMType.GPT_35_TURBO:
-            llm = get_openai_llm()
-        elif llm_type == LLMType.GPT_4:
-            llm = get_openai_llm(gpt_4=True)
-        elif llm_type == LLMType.AZURE_OPENAI:
-            llm = get_openai_llm(azure=True)
-        elif llm_type == LLMType.CLAUDE2:
-            llm = get_anthropic_llm()
-        elif llm_type == LLMType.BEDROCK_CLAUDE2:
-            llm = get_anthropic_llm(bedrock=True)
-        elif llm_type == LLMType.GEMINI:
-            llm = get_google_llm()
-        elif llm_type == LLMType.MIXTRAL:
-            llm = get_mixtral_fireworks()
-        elif llm_type == LLMType.OLLAMA:
-            llm = get_ollama_llm()
-        else:
-            raise ValueError("Unexpected llm type")
+        llm = get_llm(llm_type)
         chatbot = get_retrieval_executor(llm, retriever, system_message, CHECKPOINTER)
         super().__init__(
             llm_type=llm_type,
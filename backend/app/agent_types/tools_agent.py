@@ -1,3 +1,4 @@
+import logging
 from typing import cast
 
 from langchain.tools import BaseTool
@@ -16,6 +17,8 @@ from langgraph.prebuilt import ToolExecutor, ToolInvocation
 
 from app.message_types import LiberalToolMessage
 
+logger = logging.getLogger(__name__)
+
 
 def get_tools_agent_executor(
     tools: list[BaseTool],
@@ -24,21 +27,29 @@ def get_tools_agent_executor(
     interrupt_before_action: bool,
     checkpoint: BaseCheckpointSaver,
 ):
+    system = SystemMessage(content=system_message)
+
     async def _get_messages(messages):
-        msgs = []
+        msgs = [system]
         for m in messages:
             if isinstance(m, LiberalToolMessage):
-                _dict = m.dict()
-                _dict["content"] = str(_dict["content"])
-                m_c = ToolMessage(**_dict)
-                msgs.append(m_c)
+                msgs.append(
+                    ToolMessage(
+                        content=str(m.content),
+                        tool_call_id=m.tool_call_id,
+                        name=m.name,
+                        id=m.id,
+                        additional_kwargs=m.additional_kwargs,
+                        response_metadata=m.response_metadata,
+                    )
+                )
             elif isinstance(m, FunctionMessage):
                 # anthropic doesn't like function messages
                 msgs.append(HumanMessage(content=str(m.content)))
             else:
                 msgs.append(m)
 
-        return [SystemMessage(content=system_message)] + msgs
+        return msgs
 
     if tools:
         llm_with_tools = llm.bind_tools(tools)
@@ -52,10 +63,10 @@ def get_tools_agent_executor(
         last_message = messages[-1]
         # If there is no function call, then we finish
         if not last_message.tool_calls:
-            return "end"
-        # Otherwise if there is, we continue
+            return END
+        # Otherwise if there is, we call the tool node
         else:
-            return "continue"
+            return "action"
 
     # Define the function to execute tools
     async def call_tool(messages):
@@ -72,13 +83,22 @@ def get_tools_agent_executor(
                 )
             )
         # We call the tool_executor and get back a response
-        responses = await tool_executor.abatch(actions)
+        # The tools run concurrently, and a failing tool is reported back to
+        # the model instead of discarding the results of the others
+        responses = await tool_executor.abatch(actions, return_exceptions=True)
+        for action, response in zip(actions, responses):
+            if isinstance(response, Exception):
+                logger.warning("error calling tool %s", action.tool, exc_info=response)
         # We use the response to create a ToolMessage
         tool_messages = [
             LiberalToolMessage(
                 tool_call_id=tool_call["id"],
                 name=tool_call["name"],
-                content=response,
+                # Do not expose the error message, since it is streamed to the
+                # client and may contain sensitive information.
+                content=f"error: {type(response).__name__}"
+                if isinstance(response, Exception)
+                else response,
             )
             for tool_call, response in zip(last_message.tool_calls, responses)
         ]
@@ -100,19 +120,9 @@ def get_tools_agent_executor(
         # This means these are the edges taken after the `agent` node is called.
         "agent",
         # Next, we pass in the function that will determine which node is called next.
+        # It returns the name of that node directly, or END (a special node
+        # marking that the graph should finish), so no mapping is needed.
         should_continue,
-        # Finally we pass in a mapping.
-        # The keys are strings, and the values are other nodes.
-        # END is a special node marking that the graph should finish.
-        # What will happen is we will call `should_continue`, and then the output of that
-        # will be matched against the keys in this mapping.
-        # Based on which one it matches, that node will then be called.
-        {
-            # If `tools`, then we call the tool node.
-            "continue": "action",
-            # Otherwise we finish.
-            "end": END,
-        },
     )
 
     # We now add a normal edge from `tools` to `agent`.
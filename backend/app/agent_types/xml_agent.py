@@ -45,10 +45,15 @@ def construct_chat_history(messages):
                 temp_messages = []
             collapsed_messages.append(message)
         elif isinstance(message, LiberalFunctionMessage):
-            _dict = message.dict()
-            _dict["content"] = str(_dict["content"])
-            m_c = FunctionMessage(**_dict)
-            temp_messages.append(m_c)
+            temp_messages.append(
+                FunctionMessage(
+                    content=str(message.content),
+                    name=message.name,
+                    id=message.id,
+                    additional_kwargs=message.additional_kwargs,
+                    response_metadata=message.response_metadata,
+                )
+            )
         else:
             temp_messages.append(message)
 
@@ -59,6 +64,18 @@ def construct_chat_history(messages):
     return collapsed_messages
 
 
+_STOP_SEQUENCES = ["</tool_input>", "<observation>"]
+
+
+# Define the function that determines whether to continue or not
+def should_continue(messages):
+    last_message = messages[-1]
+    if "</tool>" in last_message.content:
+        return "action"
+    else:
+        return END
+
+
 def get_xml_agent_executor(
     tools: list[BaseTool],
     llm: LanguageModelLike,
@@ -72,24 +89,17 @@ def get_xml_agent_executor(
         tool_names=", ".join([t.name for t in tools]),
     )
 
-    llm_with_stop = llm.bind(stop=["</tool_input>", "<observation>"])
+    # The prompt only depends on the executor's arguments, so build it once
+    # rather than on every step
+    system = SystemMessage(content=formatted_system_message)
+    llm_with_stop = llm.bind(stop=_STOP_SEQUENCES)
 
     def _get_messages(messages):
-        return [
-            SystemMessage(content=formatted_system_message)
-        ] + construct_chat_history(messages)
+        return [system] + construct_chat_history(messages)
 
     agent = _get_messages | llm_with_stop
     tool_executor = ToolExecutor(tools)
 
-    # Define the function that determines whether to continue or not
-    def should_continue(messages):
-        last_message = messages[-1]
-        if "</tool>" in last_message.content:
-            return "continue"
-        else:
-            return "end"
-
     # Define the function to execute tools
     async def call_tool(messages):
         # Based on the continue condition
@@ -131,19 +141,9 @@ def get_xml_agent_executor(
         # This means these are the edges taken after the `agent` node is called.
         "agent",
         # Next, we pass in the function that will determine which node is called next.
+        # It returns the name of that node directly, or END (a special node
+        # marking that the graph should finish), so no mapping is needed.
         should_continue,
-        # Finally we pass in a mapping.
-        # The keys are strings, and the values are other nodes.
-        # END is a special node marking that the graph should finish.
-        # What will happen is we will call `should_continue`, and then the output of that
-        # will be matched against the keys in this mapping.
-        # Based on which one it matches, that node will then be called.
-        {
-            # If `tools`, then we call the tool node.
-            "continue": "action",
-            # Otherwise we finish.
-            "end": END,
-        },
     )
 
     # We now add a normal edge from `tools` to `agent`.
@@ -1,7 +1,9 @@
+import gzip
 from typing import Any, Dict, Optional, Sequence, Union
 
 import langsmith.client
-from fastapi import APIRouter, BackgroundTasks, HTTPException
+import orjson
+from fastapi import APIRouter, BackgroundTasks, HTTPException, Request, Response
 from fastapi.exceptions import RequestValidationError
 from langchain.pydantic_v1 import ValidationError
 from langchain_core.messages import AnyMessage
@@ -13,11 +15,37 @@ from sse_starlette import EventSourceResponse
 
 from app.agent import agent
 from app.auth.handlers import AuthedUser
-from app.storage import get_assistant, get_thread
+from app.storage import get_thread_assistant
 from app.stream import astream_state, to_sse
 
 router = APIRouter()
 
+# The config schema only depends on the agent's configurable fields, so it is
+# serialized (and compressed) once instead of on every request.
+_CONFIG_SCHEMA = orjson.dumps(agent.config_schema().schema())
+_CONFIG_SCHEMA_GZIP = gzip.compress(_CONFIG_SCHEMA)
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip, honouring q-values."""
+    wildcard_q = 0.0
+    for coding in accept_encoding.split(","):
+        name, _, params = coding.partition(";")
+        name = name.strip().lower()
+        q = 1.0
+        for param in params.split(";"):
+            key, _, value = param.partition("=")
+            if key.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if name == "gzip":
+            return q > 0
+        if name == "*":
+            wildcard_q = q
+    return wildcard_q > 0
+
 
 class CreateRunPayload(BaseModel):
     """Payload for creating a run."""
@@ -30,22 +58,20 @@ class CreateRunPayload(BaseModel):
 
 
 async def _run_input_and_config(payload: CreateRunPayload, user_id: str):
-    thread = await get_thread(user_id, payload.thread_id)
-    if not thread:
+    row = await get_thread_assistant(user_id, payload.thread_id)
+    if not row:
         raise HTTPException(status_code=404, detail="Thread not found")
-
-    assistant = await get_assistant(user_id, str(thread["assistant_id"]))
-    if not assistant:
+    if row["assistant_id"] is None:
         raise HTTPException(status_code=404, detail="Assistant not found")
 
     config: RunnableConfig = {
-        **assistant["config"],
+        **row["config"],
         "configurable": {
-            **assistant["config"]["configurable"],
+            **row["config"]["configurable"],
             **((payload.config or {}).get("configurable") or {}),
             "user_id": user_id,
-            "thread_id": str(thread["thread_id"]),
-            "assistant_id": str(assistant["assistant_id"]),
+            "thread_id": str(row["thread_id"]),
+            "assistant_id": str(row["assistant_id"]),
         },
     }
 
@@ -94,9 +120,19 @@ async def output_schema() -> dict:
 
 
 @router.get("/config_schema")
-async def config_schema() -> dict:
+async def config_schema(request: Request) -> Response:
     """Return the config schema of the runnable."""
-    return agent.config_schema().schema()
+    if _accepts_gzip(request.headers.get("accept-encoding", "")):
+        return Response(
+            _CONFIG_SCHEMA_GZIP,
+            media_type="application/json",
+            headers={"Content-Encoding": "gzip", "Vary": "Accept-Encoding"},
+        )
+    return Response(
+        _CONFIG_SCHEMA,
+        media_type="application/json",
+        headers={"Vary": "Accept-Encoding"},
+    )
 
 
 if tracing_is_enabled():
@@ -13,8 +13,10 @@ def get_chatbot_executor(
     system_message: str,
     checkpoint: BaseCheckpointSaver,
 ):
+    system = SystemMessage(content=system_message)
+
     def _get_messages(messages):
-        return [SystemMessage(content=system_message)] + messages
+        return [system] + messages
 
     chatbot = _get_messages | llm
 
@@ -28,12 +28,19 @@ async def _init_connection(conn) -> None:
 async def lifespan(app: FastAPI):
     global _pg_pool
 
+    min_env = os.environ.get("POSTGRES_POOL_MIN_SIZE")
+    min_size = int(min_env) if min_env else None
+    max_size = int(os.environ.get("POSTGRES_POOL_MAX_SIZE", max(10, min_size or 0)))
+    if min_size is None:
+        min_size = min(10, max_size)
     _pg_pool = await asyncpg.create_pool(
         database=os.environ["POSTGRES_DB"],
         user=os.environ["POSTGRES_USER"],
         password=os.environ["POSTGRES_PASSWORD"],
         host=os.environ["POSTGRES_HOST"],
         port=os.environ["POSTGRES_PORT"],
+        min_size=min_size,
+        max_size=max_size,
         init=_init_connection,
     )
     yield
@@ -41,3 +41,26 @@ class Thread(TypedDict):
     """The name of the thread."""
     updated_at: datetime
     """The last time the thread was updated."""
+
+
+class ThreadAssistant(TypedDict):
+    """A thread joined with its assistant.
+
+    The assistant fields are None if the thread's assistant doesn't exist or
+    isn't visible to the user.
+    """
+
+    thread_id: str
+    """The ID of the thread."""
+    assistant_id: Optional[str]
+    """The ID of the thread's assistant."""
+    user_id: Optional[str]
+    """The ID of the user that owns the assistant."""
+    name: Optional[str]
+    """The name of the assistant."""
+    config: Optional[dict]
+    """The assistant config."""
+    updated_at: Optional[datetime]
+    """The last time the assistant was updated."""
+    public: Optional[bool]
+    """Whether the assistant is public."""
@@ -6,7 +6,7 @@ from langchain_core.runnables import RunnableConfig
 
 from app.agent import agent
 from app.lifespan import get_pg_pool
-from app.schema import Assistant, Thread, User
+from app.schema import Assistant, Thread, ThreadAssistant, User
 
 
 async def list_assistants(user_id: str) -> List[Assistant]:
@@ -92,6 +92,21 @@ async def get_thread(user_id: str, thread_id: str) -> Optional[Thread]:
         )
 
 
+async def get_thread_assistant(
+    user_id: str, thread_id: str
+) -> Optional[ThreadAssistant]:
+    """Get a thread together with its assistant in a single query."""
+    async with get_pg_pool().acquire() as conn:
+        return await conn.fetchrow(
+            "SELECT t.thread_id, a.* FROM thread t "
+            "LEFT JOIN assistant a ON a.assistant_id = t.assistant_id "
+            "AND (a.user_id = $2 OR a.public IS true) "
+            "WHERE t.thread_id = $1 AND t.user_id = $2",
+            thread_id,
+            user_id,
+        )
+
+
 async def get_thread_state(*, user_id: str, thread_id: str, assistant_id: str):
     """Get state for a thread."""
     assistant = await get_assistant(user_id, assistant_id)
@@ -23,10 +23,11 @@ async def astream_state(
     async for event in app.astream_events(
         input, config, version="v1", stream_mode="values", exclude_tags=["nostream"]
     ):
-        if event["event"] == "on_chain_start" and not root_run_id:
+        kind = event["event"]
+        if kind == "on_chain_start" and not root_run_id:
             root_run_id = event["run_id"]
             yield root_run_id
-        elif event["event"] == "on_chain_stream" and event["run_id"] == root_run_id:
+        elif kind == "on_chain_stream" and event["run_id"] == root_run_id:
             new_messages: list[BaseMessage] = []
 
             # event["data"]["chunk"] is a Sequence[AnyMessage] or a Dict[str, Any]
@@ -45,7 +46,7 @@ async def astream_state(
                     new_messages.append(msg)
             if new_messages:
                 yield new_messages
-        elif event["event"] == "on_chat_model_stream":
+        elif kind == "on_chat_model_stream":
             message: BaseMessage = event["data"]["chunk"]
             if message.id not in messages:
                 messages[message.id] = message
@@ -59,6 +60,9 @@ _serializer = WellKnownLCSerializer()
 
 async def to_sse(messages_stream: MessagesStream) -> AsyncIterator[dict]:
     """Consume the stream into an EventSourceResponse"""
+    # Bound once, as these are called for every streamed token
+    dumps = _serializer.dumps
+    to_message = message_chunk_to_message
     try:
         async for chunk in messages_stream:
             # EventSourceResponse expects a string for data
@@ -72,9 +76,7 @@ async def to_sse(messages_stream: MessagesStream) -> AsyncIterator[dict]:
             else:
                 yield {
                     "event": "data",
-                    "data": _serializer.dumps(
-                        [message_chunk_to_message(msg) for msg in chunk]
-                    ).decode(),
+                    "data": dumps([to_message(msg) for msg in chunk]).decode(),
                 }
     except Exception:
         logger.warn("error in stream", exc_info=True)
@@ -210,7 +210,7 @@ def get_retriever(assistant_id: str, thread_id: str):
     )
 
 
-@lru_cache(maxsize=5)
+@lru_cache(maxsize=128)
 def get_retrieval_tool(assistant_id: str, thread_id: str, description: str):
     return create_retriever_tool(
         get_retriever(assistant_id, thread_id),
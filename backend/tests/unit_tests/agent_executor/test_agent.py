@@ -0,0 +1,31 @@
+"""Test building agents from config."""
+from langchain_core.tools import tool
+
+from app.agent import AgentType, ConfigurableAgent, get_agent_executor
+from app.tools import TOOLS, AvailableTools
+
+
+def test_same_config_reuses_executor() -> None:
+    tools = [{"type": AvailableTools.DDG_SEARCH}]
+    first = ConfigurableAgent(agent=AgentType.GPT_35_TURBO, tools=tools)
+    second = ConfigurableAgent(agent=AgentType.GPT_35_TURBO, tools=tools)
+    assert first.bound.bound is second.bound.bound
+
+
+def test_uncached_tools_skip_executor_cache(mocker) -> None:
+    def _get_uncached_tools(**kwargs):
+        @tool
+        def echo(text: str) -> str:
+            """Echo the text back."""
+            return text
+
+        return [echo]
+
+    mocker.patch.dict(TOOLS, {AvailableTools.ACTION_SERVER: _get_uncached_tools})
+    tools = [
+        {"type": AvailableTools.ACTION_SERVER, "config": {"url": "x", "api_key": "y"}}
+    ]
+    currsize = get_agent_executor.cache_info().currsize
+    ConfigurableAgent(agent=AgentType.GPT_35_TURBO, tools=tools)
+    ConfigurableAgent(agent=AgentType.GPT_35_TURBO, tools=tools)
+    assert get_agent_executor.cache_info().currsize == currsize
@@ -0,0 +1,48 @@
+"""Test the tools agent."""
+from langchain_core.messages import AIMessage, HumanMessage
+from langchain_core.runnables import RunnableLambda
+from langchain_core.tools import tool
+
+from app.agent_types.tools_agent import get_tools_agent_executor
+
+
+@tool
+def echo(text: str) -> str:
+    """Echo the text back."""
+    return f"echo: {text}"
+
+
+@tool
+def fail(text: str) -> str:
+    """Always fail."""
+    raise RuntimeError("secret-token in error message")
+
+
+class FakeToolCallingModel(RunnableLambda):
+    def bind_tools(self, tools):
+        return self
+
+
+def _model(messages):
+    if isinstance(messages[-1], HumanMessage):
+        return AIMessage(
+            content="",
+            tool_calls=[
+                {"name": "echo", "args": {"text": "hi"}, "id": "1"},
+                {"name": "fail", "args": {"text": "hi"}, "id": "2"},
+            ],
+        )
+    return AIMessage(content="done")
+
+
+async def test_failing_tool_does_not_abort_run() -> None:
+    """A failing tool is reported to the model without its error message."""
+    executor = get_tools_agent_executor(
+        [echo, fail], FakeToolCallingModel(_model), "You are a bot.", False, None
+    )
+    messages = await executor.ainvoke([HumanMessage(content="hi")])
+
+    tool_messages = {m.tool_call_id: m for m in messages if m.type == "tool"}
+    assert tool_messages["1"].content == "echo: hi"
+    assert tool_messages["2"].content == "error: RuntimeError"
+    assert messages[-1].content == "done"
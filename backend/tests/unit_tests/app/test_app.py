@@ -119,3 +119,60 @@ async def test_threads() -> None:
             headers={"Cookie": "opengpts_user_id=2"},
         )
         assert response.status_code == 422
+
+
+async def test_config_schema() -> None:
+    """Test the config schema is served compressed only when accepted."""
+    async with get_client() as client:
+        response = await client.get("/runs/config_schema")
+        assert response.status_code == 200
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["vary"] == "Accept-Encoding"
+        schema = response.json()
+        assert "configurable" in schema["properties"]
+
+        for accept_encoding in ["identity", "gzip;q=0"]:
+            response = await client.get(
+                "/runs/config_schema", headers={"Accept-Encoding": accept_encoding}
+            )
+            assert response.status_code == 200
+            assert "content-encoding" not in response.headers
+            assert response.headers["vary"] == "Accept-Encoding"
+            assert response.json() == schema
+
+
+async def test_runs_not_found(pool: asyncpg.pool.Pool) -> None:
+    """Test runs 404 on a missing thread or a missing assistant."""
+    headers = {"Cookie": "opengpts_user_id=1"}
+    aid = str(uuid4())
+    tid = str(uuid4())
+
+    async with get_client() as client:
+        response = await client.post(
+            "/runs", json={"thread_id": tid, "input": []}, headers=headers
+        )
+        assert response.status_code == 404
+        assert response.json() == {"detail": "Thread not found"}
+
+        await client.put(
+            f"/assistants/{aid}",
+            json={
+                "name": "assistant",
+                "config": {"configurable": {"type": "chatbot"}},
+                "public": False,
+            },
+            headers=headers,
+        )
+        await client.put(
+            f"/threads/{tid}",
+            json={"name": "bobby", "assistant_id": aid},
+            headers=headers,
+        )
+        async with pool.acquire() as conn:
+            await conn.execute("DELETE FROM assistant WHERE assistant_id = $1", aid)
+
+        response = await client.post(
+            "/runs", json={"thread_id": tid, "input": []}, headers=headers
+        )
+        assert response.status_code == 404
+        assert response.json() == {"detail": "Assistant not found"}